@@ -122,15 +122,18 @@ called (or the program exits).
 
 import os
 import logging
+import concurrent.futures
 import mysql.connector
 import peewee as pw
 from playhouse.mysql_ext import MySQLConnectorDatabase
 
+import random
+import re
 import socket
 import sqlite3
-import yaml
-import sshtunnel
 import threading
+import time
+import weakref
 
 from .exceptions import NoRouteToDatabase, ConnectionError
 
@@ -141,12 +144,21 @@ from .exceptions import NoRouteToDatabase, ConnectionError
 # Set module logger.
 _logger = logging.getLogger("chimedb")
 
+
+class _ThreadState(threading.local):
+    """Per-thread connector state."""
+
+    def __init__(self):
+        self.current_connector = None
+        self.current_connector_RW = None
+
+
 # Thread-local connectors: the MySQLdb module prohibits
 # multiple threads from using the same database connection
 # so we store the current connection in thread-local storage
 # NOTE: we have switched to the pure python mysql.connector package, but I've left this
 # in place for now for safety
-_threadlocal = threading.local()
+_threadlocal = _ThreadState()
 
 # This cannot be "localhost" because that is used as a special
 # value by MySQL to indicate that it should connect to a local
@@ -154,11 +166,57 @@ _threadlocal = threading.local()
 _LOCALHOST = "127.0.0.1"
 
 # We check these in order before trying chimedb.config
-_RC_FILES = [
+_RC_FILES = (
     os.path.join(os.curdir, ".chimedbrc"),
     os.path.join(os.path.expanduser("~"), ".chimedbrc"),
     "/etc/chime/chimedbrc",
-]
+)
+
+# SSH tunnels shared between MySQLConnectors.  Connectors using the same
+# tunnel host and credentials to reach the same database server (typically
+# the read-only and read-write pair) share a single tunnel, and so a single
+# SSH transport: each sshtunnel forwarder runs all its forwarded
+# connections over one paramiko Transport.  Keys are
+# (tunnel_host, tunnel_user, tunnel_identity, host, port) tuples; values are
+# [tunnel, refcount, last_checked] lists, where last_checked is the
+# time.monotonic() when the tunnel was last known to be working.  The lock
+# is re-entrant because a connector may be garbage collected, running its
+# tunnel finalizer, while the lock is held.
+_TUNNEL_POOL = dict()
+_TUNNEL_POOL_LOCK = threading.RLock()
+
+# Tunnels being set up, outside the lock, by a connector.  Keys are those of
+# _TUNNEL_POOL; values are threading.Events set once the setup is over, which
+# other connectors wanting the same tunnel wait on.
+_TUNNEL_SETUP = dict()
+
+# Default values for optional MySQL parameters in RC files
+_MYSQL_DEFAULTS = {
+    "passwd_ro": "",
+    "passwd_rw": "",
+    "port": "3306",
+    "tunnel_host": None,
+    "tunnel_user": None,
+    "tunnel_identity": None,
+}
+
+# Seconds for which a tunnel that was found to be working is assumed to still
+# be working without re-probing it.
+_TUNNEL_CHECK_INTERVAL = 5.0
+
+# Regular expressions used by _fast_parse_rc to parse RC files.  These
+# match, respectively: a "key: value" or "key:" line, a decimal integer,
+# and a string which YAML will leave as-is (if not in _YAML_NON_STRINGS).
+_RC_LINE_RE = re.compile(r"^(\s*)([A-Za-z_][A-Za-z0-9_]*):(?:\s+(\S+))?\s*$")
+_RC_INT_RE = re.compile(r"^(?:0|[1-9][0-9]*)$")
+_RC_STR_RE = re.compile(r"^[A-Za-z_/~][A-Za-z0-9_./~@+=-]*$")
+_YAML_NON_STRINGS = frozenset(
+    ["~", "null", "true", "false", "yes", "no", "on", "off", "y", "n"]
+)
+
+# Parsed RC files, keyed by path.  Each value is a ((mtime, size), contents)
+# tuple so that changes to an RC file are picked up on the next connect().
+_RC_CACHE = dict()
 
 # Cluster config
 # =============
@@ -166,17 +224,22 @@ _RC_FILES = [
 # Allow all ranks to connect to the DB
 ALL_RANKS = False
 
+# Cached result of the MPI rank check in connect_this_rank()
+_THIS_RANK_CONNECTS = None
 
-# Test-safe mode
+
+# Test-safe mode.  Once enabled, this can't be turned off again.
 _TEST_ENABLE = False
+_TEST_ENABLE_LOCK = threading.Lock()
 
 
 def test_enable():
     """Enable test-safe mode."""
     global _TEST_ENABLE
-    if not _TEST_ENABLE:
-        _logger.debug("Enabling test-safe mode")
-        _TEST_ENABLE = True
+    with _TEST_ENABLE_LOCK:
+        if not _TEST_ENABLE:
+            _logger.debug("Enabling test-safe mode")
+            _TEST_ENABLE = True
 
 
 def current_connector(read_write=False):
@@ -194,23 +257,34 @@ def current_connector(read_write=False):
     BaseConnector-derived object or None
     """
     if read_write:
-        return getattr(_threadlocal, "current_connector_RW", None)
-    return getattr(_threadlocal, "current_connector", None)
+        return _threadlocal.current_connector_RW
+    return _threadlocal.current_connector
 
 
 def connect_this_rank():
     """Returns True if we should attempt a connection to the database
     from the current MPI rank (or if no MPI support is present).
     """
+    global _THIS_RANK_CONNECTS
+
     if ALL_RANKS:
         return True
 
-    try:
-        from mpi4py import MPI
+    if _THIS_RANK_CONNECTS is None:
+        try:
+            from mpi4py import MPI
 
-        return MPI.COMM_WORLD.Get_rank() == 0
-    except ImportError:
-        return True
+            _THIS_RANK_CONNECTS = MPI.COMM_WORLD.Get_rank() == 0
+        except ImportError:
+            _THIS_RANK_CONNECTS = True
+
+    return _THIS_RANK_CONNECTS
+
+
+def _reset_rank_cache():
+    """Forget the cached result of connect_this_rank()."""
+    global _THIS_RANK_CONNECTS
+    _THIS_RANK_CONNECTS = None
 
 
 # Database Class
@@ -221,26 +295,107 @@ class RetryOperationalError(object):
     """Rewrite of the former `peewee.shortcuts.RetryOperationalError` mixin.
 
     Source: https://github.com/coleifer/peewee/issues/1472
+
+    A failed query is retried after reconnecting, up to once for each delay
+    in `_retry_sleeps`.  Each delay (in seconds) is randomly scaled by a
+    factor between 0.5 and 1.5 so that many clients losing their connection
+    at the same time don't all retry in lockstep.
     """
 
+    _retry_sleeps = (0.05, 0.15, 0.4)
+
     def execute_sql(self, sql, params=None, commit=True):
         try:
             cursor = super(RetryOperationalError, self).execute_sql(sql, params, commit)
-        except pw.OperationalError:
-            if not self.is_closed():
-                self.close()
+        except pw.OperationalError as e:
+            error = e
+        else:
+            return cursor
+
+        def query():
             with pw.__exception_wrapper__:
                 cursor = self.cursor()
                 cursor.execute(sql, params or ())
                 if commit and not self.in_transaction():
                     self.commit()
-        return cursor
+            return cursor
+
+        return self._retry(query, error, pw.OperationalError)
+
+    def _retry(self, query, error, exceptions):
+        """Retry a failed query after reconnecting.
+
+        Parameters
+        ----------
+        query : callable
+            Executes the query, returning the cursor.
+        error : Exception
+            The error from the failed query.
+        exceptions : exception class or tuple of exception classes
+            Errors from `query` which are retried.
+
+        Returns
+        -------
+        cursor
+            The cursor returned by `query`, once it succeeds.
+
+        Raises
+        ------
+        Exception
+            The error from the last attempt, if none succeed.
+        """
+        for delay in self._retry_sleeps:
+            if not self.is_closed():
+                self.close()
+            time.sleep(delay * (0.5 + random.random()))
+            try:
+                return query()
+            except exceptions as e:
+                error = e
+
+        raise error
 
 
 class MySQLDatabaseReconnect(RetryOperationalError, MySQLConnectorDatabase):
     """A MySQL database class which will automatically retry connections."""
 
-    pass
+    def execute_sql_fast(self, sql, params=None):
+        """Execute a read-only query directly on a database cursor.
+
+        This bypasses peewee's exception wrapping and transaction
+        bookkeeping, so it must only be used for queries which don't modify
+        the database (i.e. SELECT statements).  Errors executing the query
+        are raised as `mysql.connector` exceptions, not peewee ones, but
+        errors (re)connecting to the database are peewee's.  Callers should
+        be inside a `connection_context()` block.  As with `execute_sql`,
+        the query is retried after reconnecting, with the delays in
+        `_retry_sleeps`, if it fails with an OperationalError of either kind.
+
+        Parameters
+        ----------
+        sql : str
+            The query to execute.
+        params : tuple, optional
+            Parameters to interpolate into `sql`.
+
+        Returns
+        -------
+        cursor
+            The DB-API cursor used to execute the query.
+        """
+
+        def query():
+            cursor = self.cursor()
+            cursor.execute(sql, params or ())
+            return cursor
+
+        exceptions = (mysql.connector.errors.OperationalError, pw.OperationalError)
+        try:
+            return query()
+        except exceptions as e:
+            error = e
+
+        return self._retry(query, error, exceptions)
 
 
 # Connectors
@@ -295,15 +450,6 @@ class BaseConnector(object):
         Typically invoked to initialise a connector from a parsed YAML file.
         """
 
-        defaults = {
-            "passwd_ro": "",
-            "passwd_rw": "",
-            "port": "3306",
-            "tunnel_host": None,
-            "tunnel_user": None,
-            "tunnel_identity": None,
-        }
-
         # Default database type is MySQL.
         if "db_type" not in d:
             d["db_type"] = "MySQL"
@@ -314,12 +460,10 @@ class BaseConnector(object):
                 context,
             )
         elif d["db_type"].lower() == "mysql":
-            for var, default in defaults.items():
-                if var not in d:
-                    d[var] = default
+            d = {**_MYSQL_DEFAULTS, **d}
 
             if d["tunnel_identity"]:
-                d["tunnel_identity"] == os.path.expanduser(d["tunnel_identity"])
+                d["tunnel_identity"] = os.path.expanduser(d["tunnel_identity"])
 
             return (
                 [
@@ -402,6 +546,17 @@ class MySQLConnector(BaseConnector):
         self._tunnel_user = tunnel_user
         self._tunnel_identity = tunnel_identity
 
+        # time.monotonic() when the tunnel was last known to be working
+        self._tunnel_checked = 0.0
+
+        # Releases our reference to a pooled tunnel if we're garbage
+        # collected without being closed
+        self._tunnel_finalizer = None
+
+        # Cached description, and the tunnel port it was made for
+        self._description = None
+        self._description_port = None
+
     def get_connection(self):
         self.ensure_route_to_database()
         host, port = self._host_port()
@@ -417,8 +572,7 @@ class MySQLConnector(BaseConnector):
                 use_pure=True,
             )
         except mysql.connector.errors.OperationalError as e:
-            if self._tunnel is not None and self._tunnel.is_active:
-                self._tunnel.stop(force=True)
+            self._release_tunnel()
             raise ConnectionError(
                 "Operational Error while connecting to database: {0}".format(e)
             ) from e
@@ -440,18 +594,29 @@ class MySQLConnector(BaseConnector):
                     passwd=self._passwd,
                     use_pure=True,
                 )
-            except None:
-                # TODO More descriptive here.
-                raise ConnectionError("Failed to connect to database.")
+            except pw.PeeweeException as e:
+                raise ConnectionError(
+                    "Failed to connect to database: {0}".format(e)
+                ) from e
         return self._database
 
     @property
     def description(self):
+        # Only the tunnel port can change after construction
+        if (
+            self._description is not None
+            and self._description_port == self._tunnel_port
+        ):
+            return self._description
+
         out = "MySQL database at %s port %d" % (self._host, self._port)
         if self._tunnel_host:
             out += " tunnelled through {0} to localhost".format(self._tunnel_host)
             if self._tunnel_port is not None:
                 out += " port {0}".format(self._tunnel_port)
+
+        self._description = out
+        self._description_port = self._tunnel_port
         return out
 
     def _host_port(self):
@@ -465,9 +630,21 @@ class MySQLConnector(BaseConnector):
 
     def ensure_route_to_database(self):
         # Check if we need a tunnel and create one if need be.
-        if not self._tunnel_host or tunnel_active(self._tunnel_port):
+        if not self._tunnel_host:
             return
 
+        # Only probe our tunnel's local port if its SSH transport is up: a
+        # dead transport means a new tunnel, so there's no point waiting on
+        # the probe.  Don't bother probing a tunnel which was working a
+        # moment ago, either.
+        if self._tunnel is not None and self._tunnel.is_active:
+            if time.monotonic() - self._tunnel_checked < _TUNNEL_CHECK_INTERVAL:
+                return
+
+            if tunnel_active(self._tunnel_port):
+                self._tunnel_checked = time.monotonic()
+                return
+
         if not connect_this_rank():
             return
 
@@ -475,14 +652,80 @@ class MySQLConnector(BaseConnector):
         # active, presumably the connection isn't working
         self._database = None
 
+        key = self._tunnel_key()
+
+        # Our old tunnel, if any, isn't working.  If it's still pooled, make
+        # sure it's probed before anyone uses it again.
+        if self._tunnel is not None:
+            with _TUNNEL_POOL_LOCK:
+                entry = _TUNNEL_POOL.get(key)
+                if entry is not None and entry[0] is self._tunnel:
+                    entry[2] = 0.0
+        self._release_tunnel()
+
+        # The pool lock is only held briefly: it's also taken by the tunnel
+        # finalizers, which may run in any thread during garbage collection,
+        # so it mustn't be held during the SSH handshake.  Instead, only one
+        # connector at a time sets up a tunnel for each key; the others wait
+        # for it to finish and then use the pooled tunnel.
+        while True:
+            with _TUNNEL_POOL_LOCK:
+                if self._use_pooled_tunnel(key):
+                    return
+
+                setup = _TUNNEL_SETUP.get(key)
+                if setup is None:
+                    setup = _TUNNEL_SETUP[key] = threading.Event()
+
+                    # The pooled tunnel, if any, is dead.  Other connectors
+                    # still referring to it will notice it's not in the pool
+                    # anymore.
+                    entry = _TUNNEL_POOL.pop(key, None)
+                    break
+
+            setup.wait()
+
+        try:
+            if entry is not None and entry[0].is_active:
+                entry[0].stop(force=True)
+
+            tunnel = self._start_tunnel()
+
+            with _TUNNEL_POOL_LOCK:
+                self._tunnel = tunnel
+                self._tunnel_port = tunnel.local_bind_address[1]
+                self._tunnel_checked = time.monotonic()
+                _TUNNEL_POOL[key] = [tunnel, 1, self._tunnel_checked]
+                self._tunnel_finalizer = weakref.finalize(
+                    self, _release_pooled_tunnel, key, tunnel
+                )
+        finally:
+            with _TUNNEL_POOL_LOCK:
+                del _TUNNEL_SETUP[key]
+            setup.set()
+
+    def _start_tunnel(self):
+        """Start a new SSH tunnel to the database server and wait for it to
+        start listening.
+
+        Returns
+        -------
+        sshtunnel.SSHTunnelForwarder
+            The running tunnel.
+        """
+        # Imported here to avoid the cost of loading paramiko for
+        # connections that don't need a tunnel
+        import sshtunnel
+
         _logger.debug(
-            "Attempting SSH tunnel to {0}:{1} through {2}".format(
-                self._host, self._port, self._tunnel_host
-            )
+            "Attempting SSH tunnel to %s:%s through %s",
+            self._host,
+            self._port,
+            self._tunnel_host,
         )
 
         try:
-            self._tunnel = sshtunnel.SSHTunnelForwarder(
+            tunnel = sshtunnel.SSHTunnelForwarder(
                 self._tunnel_host,
                 remote_bind_address=(self._host, self._port),
                 local_bind_address=(_LOCALHOST,),
@@ -495,7 +738,7 @@ class MySQLConnector(BaseConnector):
 
         # Try to start and handle any exceptions
         try:
-            self._tunnel.start()
+            tunnel.start()
         except (
             sshtunnel.BaseSSHTunnelForwarderError,
             sshtunnel.HandlerSSHTunnelForwarderError,
@@ -504,24 +747,91 @@ class MySQLConnector(BaseConnector):
             raise NoRouteToDatabase(msg)
 
         # Get the bound port number
-        self._tunnel_port = self._tunnel.local_bind_address[1]
-
-        # Wait for the tunnel to be established
-        self._tunnel.skip_tunnel_checkup = False
-        self._tunnel.check_tunnels()  # This waits for the tunnel to come up
-        if not self._tunnel.tunnel_is_up[(_LOCALHOST, self._tunnel_port)]:
+        tunnel_port = tunnel.local_bind_address[1]
+
+        # Wait for the local end of the tunnel to start listening.  The
+        # first database connection through it will check the rest of
+        # the route.
+        for _ in range(20):
+            if tunnel_active(tunnel_port):
+                break
+            time.sleep(0.05)
+        else:
+            tunnel.stop(force=True)
             raise ConnectionError("An error occurred while setting up the tunnel.")
 
+        return tunnel
+
+    def _use_pooled_tunnel(self, key):
+        """Take a reference to the pooled tunnel with key `key`, if there's a
+        working one.
+
+        The caller must hold `_TUNNEL_POOL_LOCK`.
+
+        Returns
+        -------
+        bool
+            True if this connector is now using the pooled tunnel.
+        """
+        entry = _TUNNEL_POOL.get(key)
+        if entry is None:
+            return False
+
+        tunnel = entry[0]
+        if not tunnel.is_active:
+            return False
+
+        # If another connector has just set it up, there's no need to probe
+        # it again.
+        tunnel_port = tunnel.local_bind_address[1]
+        if time.monotonic() - entry[2] >= _TUNNEL_CHECK_INTERVAL:
+            if not tunnel_active(tunnel_port):
+                return False
+            entry[2] = time.monotonic()
+
+        _logger.debug("Re-using SSH tunnel through %s", self._tunnel_host)
+        entry[1] += 1
+        self._tunnel_checked = entry[2]
+        self._tunnel = tunnel
+        self._tunnel_port = tunnel_port
+        self._tunnel_finalizer = weakref.finalize(
+            self, _release_pooled_tunnel, key, tunnel
+        )
+        return True
+
+    def _tunnel_key(self):
+        """The key for this connector's tunnel in the tunnel pool."""
+        return (
+            self._tunnel_host,
+            self._tunnel_user,
+            self._tunnel_identity,
+            self._host,
+            self._port,
+        )
+
+    def _release_tunnel(self):
+        """Release this connector's reference to its tunnel.
+
+        The tunnel is stopped once no connector refers to it.
+        """
+        if self._tunnel is None:
+            return
+
+        # Calling the finalizer releases the reference and stops it from
+        # being released again when this connector is garbage collected
+        self._tunnel_finalizer()
+
+        self._tunnel = None
+        self._tunnel_port = None
+        self._tunnel_finalizer = None
+
     def close(self):
         """Close an open connection."""
         if self._database is not None and not self._database.is_closed():
             _logger.debug("Closing database.")
             self._database.close()
             self._database = None
-        if self._tunnel is not None and self._tunnel.is_active:
-            _logger.debug("Stopping tunnel.")
-            self._tunnel.stop(force=True)
-            self._tunnel = None
+        self._release_tunnel()
 
 
 class SqliteConnector(BaseConnector):
@@ -585,16 +895,40 @@ def tunnel_active(tunnel_port):
     if tunnel_port is None:
         return False
 
-    sd = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    # Just added this to speed things up.  I think this is enough time. -KM
-    sd.settimeout(0.5)
     try:
         # Connect to the given tunnel_port on localhost.
-        sd.connect((_LOCALHOST, tunnel_port))
-    except socket.error:
+        with socket.create_connection(
+            (_LOCALHOST, tunnel_port),
+            # A loopback connect either succeeds or is refused straight
+            # away, so there's no need to wait long.
+            timeout=0.05,
+        ):
+            return True
+    except OSError:
         return False
-    sd.close()
-    return True
+
+
+def _release_pooled_tunnel(key, tunnel):
+    """Drop a reference to `tunnel`, which has the key `key` in the tunnel
+    pool.  The tunnel is stopped once no connector refers to it.
+
+    This is called by a connector's tunnel finalizer, either when the
+    connector releases its tunnel, or when the connector is garbage
+    collected while still holding a tunnel.
+    """
+    with _TUNNEL_POOL_LOCK:
+        entry = _TUNNEL_POOL.get(key)
+        if entry is None or entry[0] is not tunnel:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _TUNNEL_POOL[key]
+
+    # Stopping the tunnel waits for its threads, so don't hold the lock
+    if tunnel.is_active:
+        _logger.debug("Stopping tunnel.")
+        tunnel.stop(force=True)
 
 
 def create_tunnel(*args, **kwargs):
@@ -616,6 +950,13 @@ def close_mysql(db):
 
 
 def _initialize_connections(connectors_to_try, context, rw=False):
+    """Returns the first connector in `connectors_to_try` which can connect
+    to the database, or None if none of them can.
+
+    This doesn't touch the thread-local connector state, so may be run in a
+    worker thread.
+    """
+    msg_conn = "Read-write" if rw else "Read-only"
     for connector in connectors_to_try:
         try:
             c = connector.get_connection()
@@ -626,25 +967,22 @@ def _initialize_connections(connectors_to_try, context, rw=False):
             mysql.connector.errors.Error,
         ) as err:
             _logger.debug(
-                "Unable to connect to {0} defined by {1}: {2}".format(
-                    connector.description, context, err
-                )
+                "Unable to connect to %s defined by %s: %s",
+                connector.description,
+                context,
+                err,
             )
             continue
-        if rw:
-            msg_conn = "Read-write"
-            _threadlocal.current_connector_RW = connector
-        else:
-            msg_conn = "Read-only"
-            _threadlocal.current_connector = connector
         _logger.info(
-            "{0} connection to {1} defined by {2} established.".format(
-                msg_conn, connector.description, context
-            )
+            "%s connection to %s defined by %s established.",
+            msg_conn,
+            connector.description,
+            context,
         )
-        break
-    else:
-        _logger.warning("Could not establish connection to CHIME database.")
+        return connector
+
+    _logger.warning("Could not establish connection to CHIME database.")
+    return None
 
 
 def _have_envvar(name):
@@ -655,52 +993,181 @@ def _have_envvar(name):
     return False
 
 
-def _try_rc_files():
-    global _RC_FILES
-    conn = dict()
+def _fast_parse_rc(text):
+    """Parse the simple YAML used by RC files without invoking PyYAML.
+
+    Only understands top-level keys holding either a plain scalar or a
+    mapping of plain scalars, which is all RC files normally contain.
+    Scalars which YAML might interpret as something other than a string
+    or a decimal integer (booleans, nulls, floats, quoted strings, etc.)
+    aren't handled.
+
+    Returns the parsed data as a dict, or None if `text` contains anything
+    not understood, in which case it should be parsed by PyYAML instead.
+    """
+    data = dict()
+    section = None
+    indent = None
+
+    for line in text.splitlines():
+        # Skip blank lines and whole-line comments
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        match = _RC_LINE_RE.match(line)
+        if match is None:
+            return None
+        line_indent, key, value = match.groups()
+
+        if not line_indent:
+            # A top-level key
+            if value is None:
+                section = data[key] = dict()
+                indent = None
+            else:
+                section = None
+                data[key] = value
+            continue
+
+        # An indented key must be in a section, with consistent indentation
+        if section is None or value is None or "\t" in line_indent:
+            return None
+        if indent is None:
+            indent = line_indent
+        elif line_indent != indent:
+            return None
+
+        section[key] = value
+
+    if not data:
+        return None
+
+    # Convert the values, or give up on ones we're not sure about
+    for key, value in data.items():
+        if isinstance(value, dict):
+            if not value:
+                # YAML would make an empty section None
+                data[key] = None
+                continue
+            for subkey, subvalue in value.items():
+                value[subkey] = _fast_parse_scalar(subvalue)
+                if value[subkey] is None:
+                    return None
+        else:
+            data[key] = _fast_parse_scalar(value)
+            if data[key] is None:
+                return None
+
+    return data
+
+
+def _fast_parse_scalar(value):
+    """Convert a scalar from an RC file for _fast_parse_rc.
+
+    Returns None if YAML may interpret `value` as something other than a
+    string or a decimal integer."""
+    if _RC_INT_RE.match(value):
+        return int(value)
+    if not _RC_STR_RE.match(value) or value.lower() in _YAML_NON_STRINGS:
+        return None
+    return value
+
+
+def _load_rc_file(rc_file):
+    """Returns the parsed contents of the YAML file `rc_file`.
+
+    The result is cached: the file is only re-parsed if its modification
+    time or size has changed since it was last read.  (The size is checked
+    because the modification time may not change if the file is rewritten
+    quickly.)
+    """
+    stat = os.stat(rc_file)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _RC_CACHE.get(rc_file)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(rc_file) as f:
+        text = f.read()
+
+    # Most RC files are simple enough to not need PyYAML
+    rc = _fast_parse_rc(text)
+
+    if rc is None:
+        # Imported here because yaml is rarely needed
+        import yaml
+
+        # Use the libyaml-based loader, if available
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        rc = yaml.load(text, Loader=SafeLoader)
+
+    _RC_CACHE[rc_file] = (version, rc)
+    return rc
+
+
+def _try_rc_files(test_mode):
     section = "chimedb"
 
     # Try the contents of CHIMEDBRC first, if given
-    if _TEST_ENABLE:
+    if test_mode:
         if _have_envvar("CHIMEDB_TEST_RC"):
-            _RC_FILES = [os.environ["CHIMEDB_TEST_RC"]]
-            if "chimedbrc" in _RC_FILES[0]:
+            rc_files = (os.environ["CHIMEDB_TEST_RC"],)
+            if "chimedbrc" in rc_files[0]:
                 # OSError is apparently the heir to EnvironmentError
                 raise OSError(
                     'Bad value for CHIMEDB_TEST_RC: cannot contain "chimedbrc"'
                 )
         else:
-            _RC_FILES = []
+            rc_files = ()
+    elif _have_envvar("CHIMEDBRC"):
+        rc_files = (os.environ["CHIMEDBRC"],) + _RC_FILES
     else:
-        if _have_envvar("CHIMEDBRC"):
-            _RC_FILES.insert(0, os.environ["CHIMEDBRC"])
+        rc_files = _RC_FILES
 
-    for rc_file in _RC_FILES:
+    for rc_file in rc_files:
+        # Most of the default locations won't exist.  _load_rc_file has to
+        # stat the file anyway, so let that find the missing ones instead of
+        # checking for them separately.
         try:
-            with open(rc_file) as f:
-                rc = yaml.safe_load(f)
-
-                # Nothing in this file, so skip it
-                if rc is None:
-                    continue
-
-                # Create the connectors
-                if section in rc:
-                    conn = BaseConnector.from_dict(rc[section], rc_file)
+            rc = _load_rc_file(rc_file)
+        except OSError:
+            # Missing or unreadable
+            continue
 
-                if conn is not None:
-                    return conn
+        # Create the connectors.  from_dict modifies its argument, so
+        # give it a copy to keep the cached data pristine.
+        if isinstance(rc, dict) and isinstance(rc.get(section), dict):
+            _logger.debug("Using RC file %s", rc_file)
+            return BaseConnector.from_dict(dict(rc[section]), rc_file)
 
-                # If we got here, things didn't work, so we try the next file
-                logging.debug("Skipping invalid RC file {0}".format(rc_file))
-        except IOError:
-            pass
+        # If we got here, things didn't work, so we try the next file
+        _logger.debug("Skipping invalid RC file %s", rc_file)
 
     # No valid file found
     return None
 
 
-def connect(reconnect=False):
+def _prewarm_connections():
+    """Open the peewee database connections of this thread's connectors."""
+    connectors = (_threadlocal.current_connector, _threadlocal.current_connector_RW)
+    for connector in connectors:
+        if connector is None:
+            continue
+        try:
+            connector.get_peewee_database().connect(reuse_if_open=True)
+        except pw.PeeweeException as e:
+            raise ConnectionError(
+                "Failed to open connection to {0}: {1}".format(connector.description, e)
+            ) from e
+
+
+def connect(reconnect=False, prewarm=False):
     """Connect to the CHIME Database.
 
     .. warning::
@@ -712,43 +1179,62 @@ def connect(reconnect=False):
     ----------
     reconnect : bool, optional
         Re-establish a connection even if one already exists.
+    prewarm : bool, optional
+        Also open the peewee database connections for the read-only and
+        read-write connectors now, rather than when they are first used.
+        Useful at application start-up, to avoid making the first query
+        wait for the connection to be made.  Peewee connections are
+        per-thread, so this only helps queries made from the calling thread.
     """
 
     # Initialise connections (only rank=0) if batch job.
     if not connect_this_rank():
         return
 
-    current_connector = getattr(_threadlocal, "current_connector", None)
-    current_connector_RW = getattr(_threadlocal, "current_connector_RW", None)
+    current_connector = _threadlocal.current_connector
+    current_connector_RW = _threadlocal.current_connector_RW
 
     if not reconnect and (
         current_connector is not None or current_connector_RW is not None
     ):
         _logger.debug("Connection already exists.")
+        if prewarm:
+            _prewarm_connections()
         return
 
-    # Check for CHIMEDB_TEST_ENABLE environtmental variable
-    if _have_envvar("CHIMEDB_TEST_ENABLE"):
+    # Check for CHIMEDB_TEST_ENABLE environtmental variable.  There's no need
+    # to look once test-safe mode is on.
+    if not _TEST_ENABLE and _have_envvar("CHIMEDB_TEST_ENABLE"):
         test_enable()
 
+    # Use the same mode throughout, even if another thread calls
+    # test_enable() while we're connecting.
+    test_mode = _TEST_ENABLE
+
+    # Sqlite connectors are quick to try, so there's no point in trying the
+    # read-only and read-write ones concurrently.
+    local = False
+
     # First look for CHIMEDB_SQLITE
-    sqlite_var = "CHIMEDB_TEST_SQLITE" if _TEST_ENABLE else "CHIMEDB_SQLITE"
+    sqlite_var = "CHIMEDB_TEST_SQLITE" if test_mode else "CHIMEDB_SQLITE"
     if _have_envvar(sqlite_var):
         connectors = [SqliteConnector(os.environ[sqlite_var], read_write=False)]
         connectors_rw = [SqliteConnector(os.environ[sqlite_var])]
         context = sqlite_var
+        local = True
     else:
-        rc_data = _try_rc_files()
+        rc_data = _try_rc_files(test_mode)
 
         if rc_data:
             connectors, connectors_rw, context = rc_data
-        elif _TEST_ENABLE:
+        elif test_mode:
             # Make an in-memory sqlite database
             connectors = [
                 SqliteConnector("file::memory:?cache=shared", read_write=False)
             ]
             connectors_rw = [SqliteConnector("file::memory:?cache=shared")]
             context = "_TEST_ENABLE"
+            local = True
         else:
             try:
                 from chimedb.config import connectors, connectors_rw
@@ -761,27 +1247,46 @@ def connect(reconnect=False):
             else:
                 context = "chimedb.config"
 
-    # Try to connect, these will raise  ConnectionError on error
-    _initialize_connections(connectors, context)
-    _initialize_connections(connectors_rw, context, True)
+    # Try to connect.  The read-only and read-write connections are
+    # independent, so establish remote ones concurrently.
+    if local:
+        connector_ro = _initialize_connections(connectors, context)
+        connector_rw = _initialize_connections(connectors_rw, context, True)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            future_ro = executor.submit(_initialize_connections, connectors, context)
+            future_rw = executor.submit(
+                _initialize_connections, connectors_rw, context, True
+            )
+            connector_ro = future_ro.result()
+            connector_rw = future_rw.result()
+
+    # The connectors are thread-local, so remember them in this thread
+    if connector_ro is not None:
+        _threadlocal.current_connector = connector_ro
+    if connector_rw is not None:
+        _threadlocal.current_connector_RW = connector_rw
 
-    # If that succeeded, remember the connectors
-    current_connector = getattr(_threadlocal, "current_connector", None)
-    current_connector_RW = getattr(_threadlocal, "current_connector_RW", None)
+    # Check that that succeeded
+    current_connector = _threadlocal.current_connector
+    current_connector_RW = _threadlocal.current_connector_RW
 
     if current_connector is None or current_connector_RW is None:
         raise ConnectionError(
             "Connection data found, but no connection could be established."
         )
 
+    if prewarm:
+        _prewarm_connections()
+
 
 def close():
     """Close all open database connections."""
-    current_connector = getattr(_threadlocal, "current_connector", None)
+    current_connector = _threadlocal.current_connector
     if current_connector:
         current_connector.close()
         _threadlocal.current_connector = None
-    current_connector_RW = getattr(_threadlocal, "current_connector_RW", None)
+    current_connector_RW = _threadlocal.current_connector_RW
     if current_connector_RW:
         current_connector_RW.close()
         _threadlocal.current_connector_RW = None
@@ -1,5 +1,6 @@
 """CHIMEdb context management."""
 
+import sys
 import logging
 import functools
 import peewee as pw
@@ -9,7 +10,7 @@ from . import connect, proxy
 _logger = logging.getLogger("chimedb")
 
 
-def atomic(_func=None, **_kwargs):
+def atomic(_func=None, *, read_write=False):
     """peewee atomic function decorator
 
     Use this to decorate a function:
@@ -54,37 +55,33 @@ def atomic(_func=None, **_kwargs):
         a read-only connection will be established.
     """
 
-    # Work-around for "def atomic(_func=None, *, read_write=False):" not working in Py2
-    if "read_write" in _kwargs:
-        read_write = _kwargs["read_write"]
-    else:
-        read_write = False
-
     def atomic_decorator(_func):
         # If this is a click group or command, shoe-horn ourselves into it by
-        # monkey patching the main() method.
+        # monkey patching the main() method.  If click hasn't been imported,
+        # _func can't be a click object, so there's no need to import it.
         _command = None
-        try:
-            import click
-
-            if isinstance(_func, click.Command):
-                _command = _func
+        click = sys.modules.get("click")
+        if click is not None and isinstance(_func, click.Command):
+            _command = _func
 
-                if getattr(_command, "__chimedb_diverted_main__", None):
-                    # already monkey patched.  This decorator has nothing to do.
-                    return _command
+            if getattr(_command, "__chimedb_diverted_main__", None):
+                # already monkey patched.  This decorator has nothing to do.
+                return _command
 
-                _func = _command.main
-                _command.__chimedb_diverted_main__ = _func
-        except ImportError:
-            pass
+            _func = _command.main
+            _command.__chimedb_diverted_main__ = _func
 
         def atomic_wrapper(*args, **kwargs):
             connect(read_write=read_write)
 
             saved_exit = None
 
-            _logger.debug("Entering atomic context")
+            # Checked per call, not per decoration, so that changes to the
+            # log level are honoured
+            debug = _logger.isEnabledFor(logging.DEBUG)
+
+            if debug:
+                _logger.debug("Entering atomic context")
             with proxy.atomic() as transaction:
                 try:
                     ret = _func(*args, **kwargs)
@@ -93,7 +90,8 @@ def atomic(_func=None, **_kwargs):
                         _logger.debug("Non-zero SystemExit.code: rolling back")
                         transaction.rollback()
                     saved_exit = e
-            _logger.debug("Exited atomic context")
+            if debug:
+                _logger.debug("Exited atomic context")
 
             if saved_exit:
                 _logger.debug("Raising delayed SystemExit")
@@ -2,8 +2,21 @@ from .orm import base_model
 from .exceptions import ValidationError
 
 import hashlib
+import hmac
 import peewee as pw
 
+# MD5 is only used to check MediaWiki's legacy "B" password hashes.  Where
+# Python supports it (3.9+), say so, which lets OpenSSL use MD5 on
+# FIPS-restricted systems.
+try:
+    hashlib.md5(usedforsecurity=False)
+except TypeError:
+    _md5 = hashlib.md5
+else:
+
+    def _md5(data=b""):
+        return hashlib.md5(data, usedforsecurity=False)
+
 
 class MediaWikiUser(base_model):
     """
@@ -35,6 +48,9 @@ class MediaWikiUser(base_model):
     user_name = pw.TextField()
     user_password = pw.TextField()
 
+    # (database, SQL) for the query in _get_user_row
+    _user_row_sql = None
+
     @classmethod
     def authenticate(cls, user, password):
         """
@@ -67,10 +83,7 @@ class MediaWikiUser(base_model):
         # UpperCase the first character of the username
         if not user or not isinstance(user, str) or len(user) < 1:
             raise UserWarning("Invalid value for username: %s" % user)
-        if len(user) > 1:
-            user = user[0].upper() + user[1:]
-        else:
-            user = user[0].upper()
+        user = user[0].upper() + user[1:]
 
         if not isinstance(password, str):
             raise UserWarning(
@@ -78,15 +91,11 @@ class MediaWikiUser(base_model):
                 % type(password).__name__
             )
 
-        try:
-            user_row = (
-                MediaWikiUser.select(MediaWikiUser.user_id, MediaWikiUser.user_password)
-                .where(MediaWikiUser.user_name == user)
-                .get()
-            )
-        except pw.DoesNotExist:
+        user_row = cls._get_user_row(user)
+        if user_row is None:
             raise UserWarning("Wrong username or password.")
-        stored_hash = user_row.user_password.split(":")
+        user_id, user_password = user_row
+        stored_hash = user_password.split(":")
 
         # All passwords are currently stored in the following way, but MediaWiki supports different
         # hashing algorithms (see https://www.mediawiki.org/wiki/Manual:User_table#user_password).
@@ -97,8 +106,40 @@ class MediaWikiUser(base_model):
             )
         _, _, salt, stored_hash = stored_hash
 
-        salted_hash = salt + "-" + hashlib.md5(password.encode("utf-8")).hexdigest()
-        hashed_salt = hashlib.md5(salted_hash.encode("utf-8")).hexdigest()
-        if hashed_salt != stored_hash:
+        # The hash is md5(salt + "-" + md5(password)), with hex digests
+        hashed_salt = _md5(salt.encode("utf-8"))
+        hashed_salt.update(b"-")
+        hashed_salt.update(_md5(password.encode("utf-8")).hexdigest().encode("ascii"))
+        if not hmac.compare_digest(
+            hashed_salt.hexdigest().encode("ascii"), stored_hash.encode("utf-8")
+        ):
             raise UserWarning("Wrong username or password.")
-        return user, user_row.user_id
+        return user, user_id
+
+    @classmethod
+    def _get_user_row(cls, user):
+        """Returns the (user_id, user_password) tuple for `user`, or None if
+        there's no such user.
+
+        The SQL for the query is generated once per database and then re-used.
+        MediaWiki user names are unique, so there's no need to limit the query.
+        The values are converted by the model's fields, as a peewee query
+        would: MediaWiki stores the password hash in a BLOB column, which the
+        database driver returns as bytes.
+        """
+        database = cls._meta.database
+        if isinstance(database, pw.Proxy):
+            database = database.obj
+
+        if cls._user_row_sql is None or cls._user_row_sql[0] is not database:
+            sql, _ = (
+                cls.select(cls.user_id, cls.user_password)
+                .where(cls.user_name == user)
+                .sql()
+            )
+            cls._user_row_sql = (database, sql)
+
+        row = database.execute_sql(cls._user_row_sql[1], (user,)).fetchone()
+        if row is None:
+            return None
+        return cls.user_id.python_value(row[0]), cls.user_password.python_value(row[1])
@@ -2,12 +2,26 @@
 Base classes for the CHIME ORM.
 """
 
+import importlib
+import pkgutil
 import time
+import weakref
 
+import chimedb
 import peewee as pw
 import ujson
+from . import connectdb
 from .exceptions import ConnectionError
 
+# If it's available, use orjson to decode JSONDictField values, since it's
+# faster.  It's not used for encoding: it can't write NaN or Infinity, nor
+# some types ujson accepts (like numpy scalars), and it doesn't escape
+# non-ASCII characters.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Logging
 # =======
 
@@ -69,9 +83,10 @@ class EnumField(pw.Field):
     def __init__(self, enum_list, *args, **kwargs):
         self.enum_list = enum_list
 
-        self.value = []
-        for e in enum_list:
-            self.value.append("'%s'" % e)
+        # For validating non-native values
+        self._enum_set = frozenset(enum_list)
+
+        self.value = tuple("'%s'" % e for e in enum_list)
 
         self.maxlen = max([len(val) for val in self.enum_list])
 
@@ -92,10 +107,10 @@ class EnumField(pw.Field):
     def coerce(self, val):
         # Coerce the db/python value to the correct output. Also perform
         # validation for non native ENUMs.
-        if self.native or val in self.enum_list:
+        if self.native or val in self._enum_set:
             return str(val or "")
         else:
-            raise TypeError("Value %s not in ENUM(%s)" % str(self.value))
+            raise TypeError("Value %s not in ENUM(%s)" % (val, ", ".join(self.value)))
 
 
 class JSONDictField(pw.TextField):
@@ -123,7 +138,15 @@ class JSONDictField(pw.TextField):
         if value is None:
             return None
 
-        pyval = ujson.loads(value)
+        if orjson is None:
+            pyval = ujson.loads(value)
+        else:
+            try:
+                pyval = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than ujson, which may have written
+                # values (like NaN) that orjson rejects
+                pyval = ujson.loads(value)
 
         if not isinstance(pyval, dict):
             raise ValueError(
@@ -147,6 +170,14 @@ class name_table(base_model):
     and :meth:`from_name` methods. They will only query the database the first
     time that a given row is requested, and then use a cached value.
 
+    Attributes
+    ----------
+    weak_cache : bool
+        If True, the cache only holds weak references to rows, so a row is
+        dropped from it once nothing else refers to it, and will be queried
+        for again next time.  Set this in subclasses for large tables whose
+        rows are rarely re-used.  Default: False
+
     Methods
     -------
     clear_cache
@@ -156,13 +187,26 @@ class name_table(base_model):
     fill_cache
     """
 
-    # Class variable holding the query cache
+    weak_cache = False
+
+    # Class variable holding the query cache.  Every subclass gets its own.
     _query_cache = dict()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._query_cache = dict()
+
     @classmethod
     def clear_cache(cls):
         """Clear any cached look-ups for this table."""
-        cls._query_cache[cls.__name__] = dict()
+        cls._query_cache = dict()
+
+    @classmethod
+    def _new_column_cache(cls):
+        """Returns an empty cache for the rows of one column."""
+        if cls.weak_cache:
+            return weakref.WeakValueDictionary()
+        return dict()
 
     @classmethod
     def get_query_cache(cls, field, val):
@@ -187,13 +231,15 @@ class name_table(base_model):
         if val is None:
             return None
 
-        class_cache = cls._query_cache.setdefault(cls.__name__, dict())
-        column_cache = class_cache.setdefault(field, dict())
+        column_cache = cls._query_cache.get(field)
+        if column_cache is None:
+            column_cache = cls._query_cache[field] = cls._new_column_cache()
 
-        if val not in column_cache:
-            column_cache[val] = cls.get(**{field: val})
+        row = column_cache.get(val)
+        if row is None:
+            row = column_cache[val] = cls.get(**{field: val})
 
-        return column_cache[val]
+        return row
 
     @classmethod
     def from_name(cls, name):
@@ -214,7 +260,11 @@ class name_table(base_model):
         row : :obj:`name_table`
           A row of the table.
         """
-        return cls.get_query_cache("name", name)
+        # Cache hits skip get_query_cache; misses query the DB anyway
+        try:
+            return cls._query_cache["name"][name]
+        except KeyError:
+            return cls.get_query_cache("name", name)
 
     @classmethod
     def from_id(cls, id):
@@ -235,7 +285,10 @@ class name_table(base_model):
         row : :obj:`name_table`
           A row of the table.
         """
-        return cls.get_query_cache("id", id)
+        try:
+            return cls._query_cache["id"][id]
+        except KeyError:
+            return cls.get_query_cache("id", id)
 
     @classmethod
     def fill_cache(cls):
@@ -243,16 +296,21 @@ class name_table(base_model):
         table.
 
         The DB is only queried the first time this is called. If the cache is
-        already full, this method does nothing.
+        already full, this method does nothing.  The filled cache holds all
+        the rows, even if `weak_cache` is set, until :meth:`clear_cache` is
+        called.
         """
 
-        class_cache = cls._query_cache.setdefault(cls.__name__, dict())
+        class_cache = cls._query_cache
 
         if "__fill_cache__" not in class_cache:
-            name_cache = class_cache.setdefault("name", dict())
-            id_cache = class_cache.setdefault("id", dict())
+            # Weakly-referenced rows would be dropped as soon as they're read
+            name_cache = class_cache["name"] = dict(class_cache.get("name", {}))
+            id_cache = class_cache["id"] = dict(class_cache.get("id", {}))
 
-            for row in cls.select():
+            # The rows are kept in the cache, so there's no need for peewee
+            # to keep its own list of them, too
+            for row in cls.select().iterator():
                 id_cache[row.id] = row
                 name_cache[row.name] = row
 
@@ -296,8 +354,6 @@ def connect_database(read_write=False, reconnect=False, ntries=1):
 
     """
 
-    from . import connectdb
-
     # Try multiple time to connect
     for i in range(ntries):
         try:
@@ -329,6 +385,10 @@ def connect_database(read_write=False, reconnect=False, ntries=1):
 
     pw_database = connector.get_peewee_database()
 
+    # Nothing more to do if the proxy is already using this database
+    if database_proxy.obj is pw_database:
+        return
+
     # Set up and register EnumField
     global EnumField
 
@@ -356,8 +416,6 @@ def create_tables(packages=None, ignore=list(), check=False):
         list tables which would be created
     """
 
-    import importlib
-
     # Ensure we have a read-write connection
     if not check:
         connect_database(read_write=True)
@@ -367,16 +425,13 @@ def create_tables(packages=None, ignore=list(), check=False):
         packages = [packages]
 
     # The ignore table could be string class names or else actual classes
-    ignore = [item if isinstance(item, str) else item.__name__ for item in ignore]
+    ignore = {item if isinstance(item, str) else item.__name__ for item in ignore}
 
     # Add abstract table classes that should always be ignored.
-    ignore.append("name_table")
+    ignore.add("name_table")
 
     # If packages was not set, try and get all subpackages of chimedb
     if packages is None:
-        import pkgutil
-        import chimedb
-
         # These subpackages we never import
         blacklist = ["chimedb.setup", "chimedb.core", "chimedb.config"]
 
@@ -394,19 +449,20 @@ def create_tables(packages=None, ignore=list(), check=False):
         except ModuleNotFoundError:
             pass
 
-    # Construct the list of tables
-    def find_tables(model, tables, ignore):
-        for cls in model.__subclasses__():
+    # Construct the list of tables by walking the subclasses of base_model
+    # depth-first.  The stack is kept in reverse so tables are listed in
+    # the order they were defined.
+    tables = []
+    stack = base_model.__subclasses__()[::-1]
+    while stack:
+        cls = stack.pop()
 
-            if cls.__name__ in ignore:
-                continue
-            tables.append(cls)
+        # Subclasses of ignored tables are ignored, too
+        if cls.__name__ in ignore:
+            continue
+        tables.append(cls)
 
-            # Look for subclasses recursively
-            find_tables(cls, tables, ignore)
-
-    tables = []
-    find_tables(base_model, tables, ignore)
+        stack.extend(cls.__subclasses__()[::-1])
 
     if check:
         tables_by_module = dict()
@@ -424,4 +480,12 @@ def create_tables(packages=None, ignore=list(), check=False):
         logger.info(
             "Creating tables: %s", ", ".join([table.__name__ for table in tables])
         )
-        database_proxy.create_tables(tables)
+        if database_proxy.in_transaction():
+            # Don't make a savepoint in the caller's transaction: MySQL
+            # commits after each CREATE, which would discard it
+            database_proxy.create_tables(tables)
+        else:
+            # Create everything in one transaction.  This saves a commit per
+            # table for Sqlite; MySQL commits after each CREATE regardless.
+            with database_proxy.atomic():
+                database_proxy.create_tables(tables)
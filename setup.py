@@ -13,7 +13,6 @@ setup(
         "peewee >= 3.12",
         "sshtunnel >= 0.4.0",
         "ujson",
-        "future",
         "PyYAML",
     ],
     author="The CHIME Collaboration",
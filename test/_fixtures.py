@@ -0,0 +1,8 @@
+"""Table models shared by the tests."""
+
+import peewee as pw
+from chimedb.core.orm import base_model
+
+
+class TestTable(base_model):
+    datum = pw.IntegerField()
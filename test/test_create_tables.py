@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+import peewee as pw
+import chimedb.core as db
+from unittest.mock import patch
+from chimedb.core import orm
+
+
+class CreatedTable(orm.base_model):
+    datum = pw.IntegerField()
+
+
+class TestCreateTables(unittest.TestCase):
+    """Test orm.create_tables."""
+
+    def setUp(self):
+        (fd, self.dbfile) = tempfile.mkstemp()
+        os.close(fd)
+
+        self.patched_env = patch.dict(
+            os.environ,
+            {
+                "CHIMEDB_TEST_SQLITE": self.dbfile,
+                "CHIMEDB_TEST_ENABLE": "1",
+                "CHIMEDB_TEST_RC": "",
+            },
+        )
+        self.patched_env.start()
+
+        db.connect(read_write=True)
+
+    def tearDown(self):
+        db.close()
+        os.remove(self.dbfile)
+
+        self.patched_env.stop()
+
+    def test_create(self):
+        orm.create_tables(packages=[])
+        self.assertTrue(CreatedTable.table_exists())
+
+    def test_in_transaction(self):
+        # No savepoint is made inside an open transaction
+        with patch.object(pw.Database, "savepoint") as savepoint:
+            with db.proxy.atomic():
+                orm.create_tables(packages=[])
+        savepoint.assert_not_called()
+        self.assertTrue(CreatedTable.table_exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,9 @@
 import os
 import sqlite3
-import tempfile
 import unittest
-import peewee as pw
 import chimedb.core as db
 from unittest.mock import patch
-from chimedb.core.orm import base_model
-
-
-class TestTable(base_model):
-    datum = pw.IntegerField()
+from _fixtures import TestTable
 
 
 datum_value = 83
@@ -20,29 +14,34 @@ class TestDecorator(unittest.TestCase):
 
     def tearDown(self):
         db.close()
-        os.remove(self.dbfile)
+        self.conn.close()
 
         self.patched_env.stop()
 
     def setUp(self):
-        # Create a temporary file
-        (fd, self.dbfile) = tempfile.mkstemp()
-        os.close(fd)
-
-        conn = sqlite3.connect(self.dbfile)
-        curs = conn.cursor()
-
-        curs.execute("CREATE TABLE testtable (datum INTEGER)")
-        curs.execute("INSERT INTO testtable VALUES (?)", (datum_value,))
+        # Use a shared-cache in-memory database.  It exists as long as a
+        # connection to it is open, so keep this one open until tearDown.
+        self.dbfile = "file:test_decorator_{0}?mode=memory&cache=shared".format(
+            id(self)
+        )
 
-        conn.commit()
-        conn.close()
+        # executescript commits the seeding itself
+        self.conn = sqlite3.connect(self.dbfile, uri=True)
+        self.conn.executescript(
+            "CREATE TABLE testtable (datum INTEGER);"
+            "INSERT INTO testtable VALUES ({0});".format(datum_value)
+        )
 
         self.patched_env = patch.dict(
             os.environ, {"CHIMEDB_TEST_SQLITE": self.dbfile, "CHIMEDB_TEST_ENABLE": "1"}
         )
         self.patched_env.start()
 
+    def committed_datum(self):
+        """Read the datum through the seeding connection, which only sees
+        committed changes."""
+        return self.conn.execute("SELECT datum FROM testtable").fetchone()[0]
+
     def test_atomic_rollback(self):
         @db.atomic(read_write=True)
         def inside_atomic():
@@ -54,9 +53,7 @@ class TestDecorator(unittest.TestCase):
         inside_atomic()
 
         # Check
-        db.close()
-        db.connect()
-        self.assertEqual(TestTable.select(TestTable.datum).scalar(), datum_value)
+        self.assertEqual(self.committed_datum(), datum_value)
 
     def test_atomic_commit(self):
         @db.atomic(read_write=True)
@@ -69,9 +66,7 @@ class TestDecorator(unittest.TestCase):
         inside_atomic()
 
         # Check
-        db.close()
-        db.connect()
-        self.assertEqual(TestTable.select(TestTable.datum).scalar(), datum_value + 1)
+        self.assertEqual(self.committed_datum(), datum_value + 1)
 
     def test_atomic_raise(self):
         @db.atomic(read_write=True)
@@ -85,9 +80,7 @@ class TestDecorator(unittest.TestCase):
             inside_atomic()
 
         # Check
-        db.close()
-        db.connect()
-        self.assertEqual(TestTable.select(TestTable.datum).scalar(), datum_value)
+        self.assertEqual(self.committed_datum(), datum_value)
 
     def test_atomic_autocommit(self):
         @db.atomic(read_write=True)
@@ -98,9 +91,7 @@ class TestDecorator(unittest.TestCase):
         inside_atomic()
 
         # Check
-        db.close()
-        db.connect()
-        self.assertEqual(TestTable.select(TestTable.datum).scalar(), datum_value + 1)
+        self.assertEqual(self.committed_datum(), datum_value + 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import patch
+from chimedb.core.orm import EnumField
+
+
+class TestEnumField(unittest.TestCase):
+    """Test EnumField validation."""
+
+    def setUp(self):
+        self.field = EnumField(["one", "two", "three"])
+
+    def test_native(self):
+        with patch.object(EnumField, "native", True):
+            self.assertEqual(self.field.coerce("four"), "four")
+            self.assertEqual(self.field.get_modifiers(), ("'one'", "'two'", "'three'"))
+
+    def test_non_native(self):
+        with patch.object(EnumField, "native", False):
+            self.assertEqual(self.field.coerce("two"), "two")
+            self.assertEqual(self.field.get_modifiers(), [5])
+
+            with self.assertRaises(TypeError):
+                self.field.coerce("four")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import unittest
+from chimedb.core import connectdb
+
+
+class TestFromDict(unittest.TestCase):
+    """Test creating connectors from RC file data."""
+
+    def test_sqlite(self):
+        ro, rw, context = connectdb.BaseConnector.from_dict(
+            {"db_type": "sqlite", "db": "test.db"}, "context"
+        )
+        self.assertIsInstance(ro[0], connectdb.SqliteConnector)
+        self.assertIsInstance(rw[0], connectdb.SqliteConnector)
+        self.assertEqual(context, "context")
+
+    def test_mysql_defaults(self):
+        ro, rw, _ = connectdb.BaseConnector.from_dict(
+            {"db": "db", "user_ro": "ro", "user_rw": "rw", "host": "host"}
+        )
+        self.assertIsInstance(ro[0], connectdb.MySQLConnector)
+        self.assertEqual(ro[0]._port, 3306)
+        self.assertEqual(ro[0]._passwd, "")
+        self.assertIsNone(rw[0]._tunnel_host)
+
+    def test_tunnel_identity(self):
+        ro, rw, _ = connectdb.BaseConnector.from_dict(
+            {
+                "db": "db",
+                "user_ro": "ro",
+                "user_rw": "rw",
+                "host": "host",
+                "tunnel_host": "gateway",
+                "tunnel_identity": "~/.ssh/id_rsa",
+            }
+        )
+        expected = os.path.expanduser("~/.ssh/id_rsa")
+        self.assertEqual(ro[0]._tunnel_identity, expected)
+        self.assertEqual(rw[0]._tunnel_identity, expected)
+
+    def test_description(self):
+        ro, _, _ = connectdb.BaseConnector.from_dict(
+            {"db": "db", "user_ro": "ro", "user_rw": "rw", "host": "host"}
+        )
+        self.assertEqual(ro[0].description, "MySQL database at host port 3306")
+
+        ro, _, _ = connectdb.BaseConnector.from_dict(
+            {
+                "db": "db",
+                "user_ro": "ro",
+                "user_rw": "rw",
+                "host": "host",
+                "tunnel_host": "gateway",
+            }
+        )
+        self.assertEqual(
+            ro[0].description,
+            "MySQL database at host port 3306 tunnelled through gateway to localhost",
+        )
+
+        # The description must follow the tunnel port
+        ro[0]._tunnel_port = 12345
+        self.assertTrue(ro[0].description.endswith("localhost port 12345"))
+
+    def test_bad_type(self):
+        with self.assertRaises(ValueError):
+            connectdb.BaseConnector.from_dict({"db_type": "oracle", "db": "db"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import math
+import unittest
+from chimedb.core.orm import JSONDictField
+
+
+class TestJSONDictField(unittest.TestCase):
+    """Test JSONDictField conversions."""
+
+    def setUp(self):
+        self.field = JSONDictField()
+
+    def test_round_trip(self):
+        value = {"a": [1, 2.5, None, True], "b": {"c": "d/é"}}
+        self.assertEqual(self.field.python_value(self.field.db_value(value)), value)
+
+    def test_non_str_keys(self):
+        self.assertEqual(
+            self.field.python_value(self.field.db_value({1: "one"})), {"1": "one"}
+        )
+
+    def test_escaped(self):
+        # Written by older versions, which escaped "/" and non-ASCII characters
+        self.assertEqual(
+            self.field.python_value('{"b":{"c":"d\\/\\u00e9"}}'), {"b": {"c": "d/é"}}
+        )
+
+    def test_non_finite(self):
+        value = self.field.python_value(
+            self.field.db_value(
+                {"nan": float("nan"), "inf": float("inf"), "-inf": float("-inf")}
+            )
+        )
+        self.assertTrue(math.isnan(value["nan"]))
+        self.assertEqual(value["inf"], float("inf"))
+        self.assertEqual(value["-inf"], float("-inf"))
+
+    def test_float_subclass(self):
+        # e.g. numpy.float64
+        class Float(float):
+            pass
+
+        self.assertEqual(
+            self.field.python_value(self.field.db_value({"a": Float(1.5)})),
+            {"a": 1.5},
+        )
+
+    def test_none(self):
+        self.assertIsNone(self.field.db_value(None))
+        self.assertIsNone(self.field.python_value(None))
+
+    def test_not_dict(self):
+        with self.assertRaises(ValueError):
+            self.field.db_value([1, 2])
+
+        with self.assertRaises(ValueError):
+            self.field.python_value("[1, 2]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,10 +7,12 @@ import tempfile
 user = "Test"
 user_id = 0
 fail_user = "Fail"
+blob_user = "Blob"
 password = "******"
+password_hash = ":B:0000ffff:e989651ffffcb5bf9b9abedfdab58460"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def db_conn():
     """Set up chimedb.core for testing with a local dummy DB."""
     (fd, rcfile) = tempfile.mkstemp(text=True)
@@ -26,22 +28,29 @@ def db_conn():
     db.connect()
     db.orm.create_tables(["chimedb.dataflag.opinion"])
 
-    # insert a user
-    pwd = ":B:0000ffff:e989651ffffcb5bf9b9abedfdab58460"
-    db.mediawiki.MediaWikiUser.get_or_create(
-        user_id=user_id, user_name=user, user_password=pwd
+    # insert a user, and a user with a password hash we don't understand
+    db.mediawiki.MediaWikiUser.insert_many(
+        [
+            {
+                "user_id": user_id,
+                "user_name": user,
+                "user_password": password_hash,
+            },
+            {"user_id": 1, "user_name": fail_user, "user_password": "1 2 3 4"},
+        ]
+    ).on_conflict_ignore().execute()
+
+    # insert a user with the password hash stored as a BLOB, as MediaWiki does
+    db.proxy.execute_sql(
+        "INSERT OR IGNORE INTO mediawikiuser VALUES (?, ?, ?)",
+        (2, blob_user, password_hash.encode("ascii")),
     )
 
-    # insert a user with a password hash we don't understand
-    pwd = "1 2 3 4"
-    db.mediawiki.MediaWikiUser.get_or_create(
-        user_id=1, user_name=fail_user, user_password=pwd
-    )
-    db.close()
-
+    # Keep the connection open for the tests
     yield
 
     # tear down
+    db.close()
     os.remove(rcfile)
 
 
@@ -57,4 +66,7 @@ def test_user_authentication(db_conn):
 
     assert db.mediawiki.MediaWikiUser.authenticate(user, password) is not None
 
-    db.close()
+
+def test_blob_password(db_conn):
+    result = db.mediawiki.MediaWikiUser.authenticate(blob_user, password)
+    assert result == (blob_user, 2)
@@ -0,0 +1,97 @@
+import gc
+import os
+import tempfile
+import unittest
+import peewee as pw
+import chimedb.core as db
+from unittest.mock import patch
+from chimedb.core.orm import name_table
+
+
+class NameTableA(name_table):
+    name = pw.CharField()
+
+
+class NameTableB(name_table):
+    name = pw.CharField()
+
+
+class WeakNameTable(name_table):
+    name = pw.CharField()
+    weak_cache = True
+
+
+class TestNameTable(unittest.TestCase):
+    """Test the name_table query cache."""
+
+    def setUp(self):
+        (fd, self.dbfile) = tempfile.mkstemp()
+        os.close(fd)
+
+        self.patched_env = patch.dict(
+            os.environ, {"CHIMEDB_TEST_SQLITE": self.dbfile, "CHIMEDB_TEST_ENABLE": "1"}
+        )
+        self.patched_env.start()
+
+        db.connect(read_write=True)
+        db.proxy.create_tables([NameTableA, NameTableB, WeakNameTable])
+        NameTableA.insert_many([{"name": "a1"}, {"name": "a2"}]).execute()
+        NameTableB.insert_many([{"name": "b1"}]).execute()
+        WeakNameTable.insert_many([{"name": "w1"}]).execute()
+
+        NameTableA.clear_cache()
+        NameTableB.clear_cache()
+        WeakNameTable.clear_cache()
+
+    def tearDown(self):
+        db.close()
+        os.remove(self.dbfile)
+
+        self.patched_env.stop()
+
+    def test_from_name(self):
+        row = NameTableA.from_name("a1")
+        self.assertEqual(row.name, "a1")
+        self.assertIs(NameTableA.from_name("a1"), row)
+        self.assertIs(NameTableA.from_id(row.id), NameTableA.from_id(row.id))
+        self.assertIsNone(NameTableA.from_name(None))
+
+        with self.assertRaises(pw.DoesNotExist):
+            NameTableA.from_name("b1")
+
+    def test_per_class(self):
+        a = NameTableA.from_id(1)
+        b = NameTableB.from_id(1)
+        self.assertEqual(a.name, "a1")
+        self.assertEqual(b.name, "b1")
+
+        NameTableA.clear_cache()
+        self.assertIsNot(NameTableA.from_id(1), a)
+        self.assertIs(NameTableB.from_id(1), b)
+
+    def test_fill_cache(self):
+        NameTableA.fill_cache()
+
+        # Once the cache is full, the table isn't needed
+        NameTableA.delete().execute()
+        self.assertEqual(NameTableA.from_name("a2").name, "a2")
+        self.assertEqual(NameTableA.from_id(1).name, "a1")
+
+    def test_weak_cache(self):
+        row = WeakNameTable.from_name("w1")
+        self.assertIs(WeakNameTable.from_name("w1"), row)
+
+        # Dropped once unreferenced
+        del row
+        gc.collect()
+        self.assertEqual(len(WeakNameTable._query_cache["name"]), 0)
+
+        # ...but not after filling the cache
+        WeakNameTable.fill_cache()
+        gc.collect()
+        WeakNameTable.delete().execute()
+        self.assertEqual(WeakNameTable.from_name("w1").name, "w1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import yaml
+from chimedb.core import connectdb
+
+
+class TestFastParseRC(unittest.TestCase):
+    """Test the PyYAML-free RC file parser against PyYAML."""
+
+    def assertSameAsYAML(self, text):
+        self.assertEqual(connectdb._fast_parse_rc(text), yaml.safe_load(text))
+
+    def test_mysql(self):
+        self.assertSameAsYAML(
+            """\
+# A comment
+chimedb:
+    db_type:         mysql
+    db:              chime
+    user_ro:         reader
+    passwd_ro:       secret+pw
+    user_rw:         writer
+
+    host:            db.example.com
+    port:            3306
+    tunnel_host:     gateway.example.com
+    tunnel_user:     user_name
+    tunnel_identity: ~/.ssh/id_rsa
+"""
+        )
+
+    def test_sqlite(self):
+        self.assertSameAsYAML(
+            """\
+chimedb:
+  db_type: sqlite
+  db: /path/to/chime.db
+"""
+        )
+
+    def test_other_sections(self):
+        self.assertSameAsYAML(
+            """\
+other: value
+empty:
+chimedb:
+  db: db
+"""
+        )
+
+    def test_fallback(self):
+        # Things _fast_parse_rc should leave to PyYAML
+        for text in [
+            "",
+            "chimedb:\n  db: 'quoted'\n",
+            "chimedb:\n  passwd_ro: yes\n",
+            "chimedb:\n  passwd_ro: null\n",
+            "chimedb:\n  passwd_ro: ~\n",
+            "chimedb:\n  port: 0123\n",
+            "chimedb:\n  host: 10.0.0.1\n",
+            "chimedb:\n  db: chime # comment\n",
+            "chimedb:\n  passwd_ro: two words\n",
+            "chimedb:\n  passwd_ro: p#ss\n",
+            "chimedb:\n  db: chime\n    host: host\n",
+            "chimedb:\n\tdb: chime\n",
+            "chimedb: {db: chime}\n",
+            "  db: chime\n",
+            "---\nchimedb:\n  db: chime\n",
+        ]:
+            self.assertIsNone(connectdb._fast_parse_rc(text), repr(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import sqlite3
+import unittest
+import mysql.connector
+import peewee as pw
+from unittest.mock import MagicMock, patch
+from chimedb.core import connectdb
+
+
+class FakeCursor:
+    """A cursor whose first `failures` executions fail."""
+
+    def __init__(self, database):
+        self.database = database
+
+    def execute(self, sql, params):
+        database = self.database
+        database.log.append("execute")
+        if database.failures > 0:
+            database.failures -= 1
+            raise sqlite3.OperationalError(
+                "attempt {0} failed".format(database.log.count("execute"))
+            )
+
+
+class FakeDatabase:
+    """Just enough of a peewee database for RetryOperationalError."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.closed = False
+        self.log = []
+
+    def execute_sql(self, sql, params=None, commit=True):
+        with pw.__exception_wrapper__:
+            cursor = self.cursor()
+            cursor.execute(sql, params or ())
+        return cursor
+
+    def cursor(self):
+        self.closed = False
+        return FakeCursor(self)
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.log.append("close")
+        self.closed = True
+
+    def in_transaction(self):
+        return False
+
+    def commit(self):
+        pass
+
+
+class RetryDatabase(connectdb.RetryOperationalError, FakeDatabase):
+    _retry_sleeps = (0, 0, 0)
+
+
+class TestRetryOperationalError(unittest.TestCase):
+    """Test retrying queries after an OperationalError."""
+
+    def test_no_failure(self):
+        database = RetryDatabase(0)
+        self.assertIsInstance(database.execute_sql("SELECT 1"), FakeCursor)
+        self.assertEqual(database.log, ["execute"])
+
+    def test_retry(self):
+        database = RetryDatabase(2)
+        self.assertIsInstance(database.execute_sql("SELECT 1"), FakeCursor)
+
+        # The connection is closed before each retry
+        self.assertEqual(
+            database.log, ["execute", "close", "execute", "close", "execute"]
+        )
+
+    def test_give_up(self):
+        database = RetryDatabase(4)
+        with self.assertRaises(pw.OperationalError) as cm:
+            database.execute_sql("SELECT 1")
+        self.assertEqual(str(cm.exception), "attempt 4 failed")
+        self.assertEqual(database.log, ["execute", "close"] * 3 + ["execute"])
+
+    def test_other_error(self):
+        database = RetryDatabase(0)
+        with patch.object(
+            FakeDatabase, "execute_sql", side_effect=pw.IntegrityError("duplicate")
+        ):
+            with self.assertRaises(pw.IntegrityError):
+                database.execute_sql("INSERT")
+        self.assertEqual(database.log, [])
+
+
+class TestExecuteSqlFast(unittest.TestCase):
+    """Test MySQLDatabaseReconnect.execute_sql_fast without a server."""
+
+    def setUp(self):
+        self.database = connectdb.MySQLDatabaseReconnect("db")
+        self.database._retry_sleeps = (0, 0, 0)
+        self.cursor = MagicMock()
+
+    def test_execute(self):
+        with patch.object(self.database, "cursor", return_value=self.cursor):
+            self.assertIs(self.database.execute_sql_fast("SELECT 1"), self.cursor)
+        self.cursor.execute.assert_called_once_with("SELECT 1", ())
+
+    def test_query_error(self):
+        failing = MagicMock()
+        failing.execute.side_effect = mysql.connector.errors.OperationalError()
+
+        with patch.object(self.database, "cursor", side_effect=[failing, self.cursor]):
+            self.assertIs(self.database.execute_sql_fast("SELECT ?", (1,)), self.cursor)
+        self.cursor.execute.assert_called_once_with("SELECT ?", (1,))
+
+    def test_connect_error(self):
+        # Connecting goes through peewee
+        with patch.object(
+            self.database,
+            "cursor",
+            side_effect=[pw.OperationalError("reconnect failed"), self.cursor],
+        ):
+            self.assertIs(self.database.execute_sql_fast("SELECT 1"), self.cursor)
+
+    def test_give_up(self):
+        failing = MagicMock()
+        failing.execute.side_effect = mysql.connector.errors.OperationalError()
+
+        with patch.object(self.database, "cursor", return_value=failing):
+            with self.assertRaises(mysql.connector.errors.OperationalError):
+                self.database.execute_sql_fast("SELECT 1")
+
+        # One attempt, plus a retry for each delay
+        self.assertEqual(failing.execute.call_count, 4)
+
+    def test_retry_sleeps(self):
+        failing = MagicMock()
+        failing.execute.side_effect = mysql.connector.errors.OperationalError()
+
+        self.database._retry_sleeps = (1, 2)
+        with patch.object(self.database, "cursor", return_value=failing):
+            with patch("time.sleep") as sleep:
+                with self.assertRaises(mysql.connector.errors.OperationalError):
+                    self.database.execute_sql_fast("SELECT 1")
+
+        # Each delay is jittered by a factor between 0.5 and 1.5
+        delays = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0.5 <= delays[0] <= 1.5)
+        self.assertTrue(1 <= delays[1] <= 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
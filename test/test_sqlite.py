@@ -1,15 +1,13 @@
 import os
+import shutil
 import sqlite3
 import tempfile
 import unittest
 import peewee as pw
 import chimedb.core as db
+from chimedb.core import connectdb
 from unittest.mock import patch
-from chimedb.core.orm import base_model
-
-
-class TestTable(base_model):
-    datum = pw.IntegerField()
+from _fixtures import TestTable
 
 
 datum_value = 83
@@ -18,33 +16,50 @@ datum_value = 83
 class TestSqlite(unittest.TestCase):
     """Rudemintary tests of connectdb using sqlite"""
 
+    @classmethod
+    def setUpClass(cls):
+        # All the files for the tests go in here
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+        # Create a template database, copied for each test
+        cls.template_dbfile = os.path.join(cls.tmpdir.name, "template.db")
+
+        # This database is thrown away after the tests: don't bother syncing.
+        # executescript commits the seeding itself.
+        conn = sqlite3.connect(cls.template_dbfile)
+        conn.executescript(
+            "PRAGMA synchronous=OFF;"
+            "PRAGMA journal_mode=MEMORY;"
+            "CREATE TABLE testtable (datum INTEGER);"
+            "INSERT INTO testtable VALUES ({0});".format(datum_value)
+        )
+        conn.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
     def tearDown(self):
         self.patched_env.stop()
         db.close()
-        os.remove(self.dbfile)
 
     def setUp(self):
-        # Create a temporary file
-        (fd, self.dbfile) = tempfile.mkstemp()
-        os.close(fd)
-
-        conn = sqlite3.connect(self.dbfile)
-        curs = conn.cursor()
-
-        curs.execute("CREATE TABLE testtable (datum INTEGER)")
-        curs.execute("INSERT INTO testtable VALUES (?)", (datum_value,))
-
-        conn.commit()
-        conn.close()
+        # Create a copy of the template for this test
+        self.dbfile = os.path.join(self.tmpdir.name, self._testMethodName + ".db")
+        shutil.copyfile(self.template_dbfile, self.dbfile)
+        self.rcfile = os.path.join(self.tmpdir.name, self._testMethodName + ".rc")
 
+        # chimedb treats empty variables as unset
         self.patched_env = patch.dict(
-            os.environ, {"CHIMEDB_TEST_SQLITE": self.dbfile, "CHIMEDB_TEST_ENABLE": "1"}
+            os.environ,
+            {
+                "CHIMEDB_TEST_SQLITE": self.dbfile,
+                "CHIMEDB_TEST_ENABLE": "1",
+                "CHIMEDB_TEST_RC": "",
+            },
         )
         self.patched_env.start()
 
-        if "CHIMEDB_TEST_RC" in os.environ:
-            del os.environ["CHIMEDB_TEST_RC"]
-
     def test_connect(self):
         db.connect()
         self.assertEqual(TestTable.select(TestTable.datum).scalar(), datum_value)
@@ -63,6 +78,21 @@ class TestSqlite(unittest.TestCase):
         TestTable.update(datum=datum_value * 2).execute()
         self.assertEqual(TestTable.select(TestTable.datum).scalar(), datum_value * 2)
 
+    def test_prewarm(self):
+        connectdb.connect(prewarm=True)
+        for read_write in (False, True):
+            connector = connectdb.current_connector(read_write)
+            self.assertFalse(connector.get_peewee_database().is_closed())
+
+    def test_prewarm_failure(self):
+        with patch.object(
+            connectdb.SqliteConnector,
+            "get_peewee_database",
+            side_effect=pw.InterfaceError("unreachable"),
+        ):
+            with self.assertRaises(db.exceptions.ConnectionError):
+                connectdb.connect(prewarm=True)
+
     def test_switch_connection(self):
         self.test_connect_ro()
         self.test_connect_rw()
@@ -70,9 +100,8 @@ class TestSqlite(unittest.TestCase):
         self.assertEqual(TestTable.select(TestTable.datum).scalar(), datum_value * 2)
 
     def test_rcfile(self):
-        # Create a temporary file
-        (fd, rcfile) = tempfile.mkstemp(text=True)
-        with os.fdopen(fd, "a") as rc:
+        # Create an RC file
+        with open(self.rcfile, "w") as rc:
             rc.write(
                 """\
 chimedb:
@@ -84,12 +113,47 @@ chimedb:
             )
 
         del os.environ["CHIMEDB_TEST_SQLITE"]
-        os.environ["CHIMEDB_TEST_RC"] = rcfile
+        os.environ["CHIMEDB_TEST_RC"] = self.rcfile
 
         # We run this test to make sure BaseConnector.from_dict has made both
         # connectors correctly.
         self.test_switch_connection()
-        os.unlink(rcfile)
+
+    def test_rcfile_modified(self):
+        # Create an RC file pointing to a database in a non-existent directory
+        with open(self.rcfile, "w") as rc:
+            rc.write(
+                """\
+chimedb:
+    db_type: sqlite
+    db: {0}.missing/db
+""".format(
+                    self.dbfile
+                )
+            )
+
+        del os.environ["CHIMEDB_TEST_SQLITE"]
+        os.environ["CHIMEDB_TEST_RC"] = self.rcfile
+
+        with self.assertRaises(db.ConnectionError):
+            db.connect()
+
+        # Now fix the RC file.  The parsed file is cached, so make sure
+        # the modification time changes.
+        with open(self.rcfile, "w") as rc:
+            rc.write(
+                """\
+chimedb:
+    db_type: sqlite
+    db: {0}
+""".format(
+                    self.dbfile
+                )
+            )
+        mtime = os.stat(self.rcfile).st_mtime
+        os.utime(self.rcfile, (mtime + 1, mtime + 1))
+
+        self.test_connect()
 
 
 if __name__ == "__main__":
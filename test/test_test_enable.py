@@ -1,14 +1,9 @@
 import os
 import tempfile
 import unittest
-import peewee as pw
 import chimedb.core as db
 from unittest.mock import patch
-from chimedb.core.orm import base_model
-
-
-class TestTable(base_model):
-    datum = pw.IntegerField()
+from _fixtures import TestTable
 
 
 datum_value = 84
@@ -17,28 +12,41 @@ datum_value = 84
 class TestSafeMode(unittest.TestCase):
     """Test using test_enable() for testing"""
 
+    @classmethod
+    def setUpClass(cls):
+        # All the files for the tests go in here
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def tmpfile(self, ext):
+        """Returns the path to a new, empty file for this test."""
+        path = os.path.join(self.tmpdir.name, self._testMethodName + ext)
+        open(path, "w").close()
+        return path
+
     def tearDown(self):
         self.patched_env.stop()
 
     def setUp(self):
-        self.patched_env = patch.dict(os.environ)
+        # chimedb treats empty variables as unset
+        self.patched_env = patch.dict(
+            os.environ,
+            {
+                "CHIMEDB_TEST_ENABLE": "",
+                "CHIMEDB_SQLITE": "",
+                "CHIMEDBRC": "",
+                "CHIMEDB_TEST_SQLITE": "",
+                "CHIMEDB_TEST_RC": "",
+            },
+        )
         self.patched_env.start()
 
-        if "CHIMEDB_TEST_ENABLE" in os.environ:
-            del os.environ["CHIMEDB_TEST_ENABLE"]
-        if "CHIMEDB_SQLITE" in os.environ:
-            del os.environ["CHIMEDB_SQLITE"]
-        if "CHIMEDBRC" in os.environ:
-            del os.environ["CHIMEDBRC"]
-        if "CHIMEDB_TEST_SQLITE" in os.environ:
-            del os.environ["CHIMEDB_TEST_SQLITE"]
-        if "CHIMEDB_TEST_RC" in os.environ:
-            del os.environ["CHIMEDB_TEST_RC"]
-
     def test_chimedb_test_sqlite(self):
         # Create an empty on-disk sqlite database
-        (fd, dbfile) = tempfile.mkstemp(text=True)
-        os.close(fd)
+        dbfile = self.tmpfile(".db")
 
         os.environ["CHIMEDB_TEST_SQLITE"] = dbfile
 
@@ -53,14 +61,12 @@ class TestSafeMode(unittest.TestCase):
         db.close()
 
         # The on-disk sqlite database should not be empty anymore
-        stat = os.stat(dbfile)
-        self.assertNotEqual(stat.st_size, 0)
+        self.assertGreater(os.path.getsize(dbfile), 0)
 
     def test_chimedb_test_enable_envvar(self):
         # Like test_chimedb_test_sqlite, but using the envvar to turn on
         # test mode.
-        (fd, dbfile) = tempfile.mkstemp(text=True)
-        os.close(fd)
+        dbfile = self.tmpfile(".db")
 
         os.environ["CHIMEDB_TEST_SQLITE"] = dbfile
         os.environ["CHIMEDB_TEST_ENABLE"] = "1"
@@ -74,13 +80,11 @@ class TestSafeMode(unittest.TestCase):
         db.close()
 
         # The on-disk sqlite database should not be empty anymore
-        stat = os.stat(dbfile)
-        self.assertNotEqual(stat.st_size, 0)
+        self.assertGreater(os.path.getsize(dbfile), 0)
 
     def test_chimedb_test_sqlite(self):
         # Create an empty on-disk sqlite database
-        (fd, dbfile) = tempfile.mkstemp(text=True)
-        os.close(fd)
+        dbfile = self.tmpfile(".db")
 
         os.environ["CHIMEDB_TEST_SQLITE"] = dbfile
 
@@ -95,13 +99,11 @@ class TestSafeMode(unittest.TestCase):
         db.close()
 
         # The on-disk sqlite database should not be empty anymore
-        stat = os.stat(dbfile)
-        self.assertNotEqual(stat.st_size, 0)
+        self.assertGreater(os.path.getsize(dbfile), 0)
 
     def test_chimedb_sqlite(self):
         # Create an empty on-disk sqlite database that won't be used
-        (fd, dbfile) = tempfile.mkstemp(text=True)
-        os.close(fd)
+        dbfile = self.tmpfile(".db")
 
         # This should be ignored
         os.environ["CHIMEDB_SQLITE"] = dbfile
@@ -117,18 +119,15 @@ class TestSafeMode(unittest.TestCase):
         db.close()
 
         # The on-disk sqlite database should still be empty
-        stat = os.stat(dbfile)
-        self.assertEqual(stat.st_size, 0)
-        os.remove(dbfile)
+        self.assertEqual(os.path.getsize(dbfile), 0)
 
     def test_chimedbrc(self):
         # Create an empty on-disk sqlite database that won't be used
-        (fd, dbfile) = tempfile.mkstemp(text=True)
-        os.close(fd)
+        dbfile = self.tmpfile(".db")
 
         # Create a rcfile
-        (fd, rcfile) = tempfile.mkstemp(text=True)
-        with os.fdopen(fd, "a") as rc:
+        rcfile = self.tmpfile(".rc")
+        with open(rcfile, "w") as rc:
             rc.write(
                 """\
 chimedb:
@@ -153,20 +152,15 @@ chimedb:
         db.close()
 
         # The on-disk sqlite database should still be empty
-        stat = os.stat(dbfile)
-        self.assertEqual(stat.st_size, 0)
-
-        os.unlink(rcfile)
-        os.unlink(dbfile)
+        self.assertEqual(os.path.getsize(dbfile), 0)
 
     def test_chimedb_test_rc(self):
         # Create an empty on-disk sqlite database
-        (fd, dbfile) = tempfile.mkstemp(text=True)
-        os.close(fd)
+        dbfile = self.tmpfile(".db")
 
         # Create a rcfile
-        (fd, rcfile) = tempfile.mkstemp(text=True)
-        with os.fdopen(fd, "a") as rc:
+        rcfile = self.tmpfile(".rc")
+        with open(rcfile, "w") as rc:
             rc.write(
                 """\
 chimedb:
@@ -191,11 +185,7 @@ chimedb:
         db.close()
 
         # The on-disk sqlite database should not be empty
-        stat = os.stat(dbfile)
-        self.assertNotEqual(stat.st_size, 0)
-
-        os.unlink(rcfile)
-        os.unlink(dbfile)
+        self.assertGreater(os.path.getsize(dbfile), 0)
 
     def test_no_chimedbrc(self):
         # This is not allowed
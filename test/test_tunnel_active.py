@@ -0,0 +1,29 @@
+import socket
+import unittest
+from chimedb.core import connectdb
+
+
+class TestTunnelActive(unittest.TestCase):
+    """Test probing local tunnel ports."""
+
+    def setUp(self):
+        self.server = socket.socket()
+        self.server.bind((connectdb._LOCALHOST, 0))
+        self.port = self.server.getsockname()[1]
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_listening(self):
+        self.server.listen(1)
+        self.assertTrue(connectdb.tunnel_active(self.port))
+
+    def test_not_listening(self):
+        self.assertFalse(connectdb.tunnel_active(self.port))
+
+    def test_no_port(self):
+        self.assertFalse(connectdb.tunnel_active(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+import gc
+import socket
+import sys
+import threading
+import types
+import unittest
+from unittest.mock import patch
+from chimedb.core import connectdb
+
+
+class FakeForwarder:
+    """Stand-in for sshtunnel.SSHTunnelForwarder, listening locally."""
+
+    # All the forwarders made
+    made = []
+
+    # If set, called by start()
+    on_start = None
+
+    def __init__(self, host, **kwargs):
+        self.is_active = False
+        self.server = socket.socket()
+        self.server.bind((connectdb._LOCALHOST, 0))
+        self.local_bind_address = self.server.getsockname()
+        self.made.append(self)
+
+    def start(self):
+        if FakeForwarder.on_start is not None:
+            FakeForwarder.on_start()
+        self.server.listen(8)
+        self.is_active = True
+
+    def stop(self, force=False):
+        self.is_active = False
+        self.server.close()
+
+
+class TestTunnelPool(unittest.TestCase):
+    """Test sharing SSH tunnels between MySQLConnectors."""
+
+    def setUp(self):
+        sshtunnel = types.ModuleType("sshtunnel")
+        sshtunnel.SSHTunnelForwarder = FakeForwarder
+        sshtunnel.BaseSSHTunnelForwarderError = RuntimeError
+        sshtunnel.HandlerSSHTunnelForwarderError = RuntimeError
+
+        self.patched_modules = patch.dict(sys.modules, {"sshtunnel": sshtunnel})
+        self.patched_modules.start()
+
+        FakeForwarder.made = []
+        FakeForwarder.on_start = None
+
+        self.ro = self.connector("ro")
+        self.rw = self.connector("rw")
+
+    def tearDown(self):
+        self.ro.close()
+        self.rw.close()
+        for tunnel in FakeForwarder.made:
+            tunnel.stop()
+        connectdb._TUNNEL_POOL.clear()
+
+        self.patched_modules.stop()
+
+    def connector(self, user):
+        return connectdb.MySQLConnector(
+            "db", user, "", "dbhost", 3306, "gateway", "tunnel_user"
+        )
+
+    def test_shared(self):
+        self.ro.ensure_route_to_database()
+        self.rw.ensure_route_to_database()
+
+        self.assertEqual(len(FakeForwarder.made), 1)
+        self.assertIs(self.ro._tunnel, self.rw._tunnel)
+        self.assertEqual(self.ro._tunnel_port, self.rw._tunnel_port)
+
+    def test_close(self):
+        self.ro.ensure_route_to_database()
+        self.rw.ensure_route_to_database()
+        tunnel = self.ro._tunnel
+
+        # The tunnel stays up while one connector is using it
+        self.ro.close()
+        self.assertTrue(tunnel.is_active)
+        self.assertIsNone(self.ro._tunnel)
+
+        self.rw.close()
+        self.assertFalse(tunnel.is_active)
+        self.assertEqual(connectdb._TUNNEL_POOL, {})
+
+    def test_replace_stopped(self):
+        self.ro.ensure_route_to_database()
+        self.rw.ensure_route_to_database()
+        old_tunnel = self.ro._tunnel
+        old_tunnel.stop()
+
+        self.ro.ensure_route_to_database()
+        self.assertEqual(len(FakeForwarder.made), 2)
+        self.assertIsNot(self.ro._tunnel, old_tunnel)
+        self.assertTrue(self.ro._tunnel.is_active)
+
+        # The other connector picks up the replacement
+        self.rw.ensure_route_to_database()
+        self.assertEqual(len(FakeForwarder.made), 2)
+        self.assertIs(self.rw._tunnel, self.ro._tunnel)
+
+        # Releasing the dead tunnel doesn't affect the new one
+        self.assertEqual(len(connectdb._TUNNEL_POOL), 1)
+        (entry,) = connectdb._TUNNEL_POOL.values()
+        self.assertEqual(entry[1], 2)
+
+    def test_replace_unreachable(self):
+        self.ro.ensure_route_to_database()
+        self.rw.ensure_route_to_database()
+        old_tunnel = self.ro._tunnel
+
+        # The forwarder stops listening, but still claims to be active
+        old_tunnel.server.close()
+        self.ro._tunnel_checked = 0.0
+
+        self.ro.ensure_route_to_database()
+        self.assertIsNot(self.ro._tunnel, old_tunnel)
+        self.assertTrue(connectdb.tunnel_active(self.ro._tunnel_port))
+
+    def test_reuse_keeps_check_time(self):
+        self.ro.ensure_route_to_database()
+        (entry,) = connectdb._TUNNEL_POOL.values()
+        last_checked = entry[2]
+
+        # Re-using a recently checked tunnel doesn't count as checking it
+        self.rw.ensure_route_to_database()
+        self.assertEqual(entry[2], last_checked)
+        self.assertEqual(self.rw._tunnel_checked, last_checked)
+
+    def test_garbage_collected(self):
+        self.ro.ensure_route_to_database()
+        self.rw.ensure_route_to_database()
+        tunnel = self.ro._tunnel
+
+        self.ro = self.connector("ro")
+        gc.collect()
+        self.assertTrue(tunnel.is_active)
+
+        self.rw = self.connector("rw")
+        gc.collect()
+        self.assertFalse(tunnel.is_active)
+        self.assertEqual(connectdb._TUNNEL_POOL, {})
+
+    def test_unlocked_start(self):
+        locked = []
+
+        def on_start():
+            # Another thread, e.g. one garbage collecting a connector, must be
+            # able to take the pool lock during the SSH handshake
+            def try_lock():
+                if connectdb._TUNNEL_POOL_LOCK.acquire(timeout=1):
+                    connectdb._TUNNEL_POOL_LOCK.release()
+                else:
+                    locked.append(True)
+
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+
+        FakeForwarder.on_start = on_start
+        self.ro.ensure_route_to_database()
+        self.assertEqual(locked, [])
+
+    def test_concurrent_setup(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def on_start():
+            # Hold up the handshake until the other connector is waiting
+            started.set()
+            release.wait(5)
+
+        FakeForwarder.on_start = on_start
+        thread = threading.Thread(target=self.ro.ensure_route_to_database)
+        thread.start()
+        started.wait(5)
+
+        rw_thread = threading.Thread(target=self.rw.ensure_route_to_database)
+        rw_thread.start()
+
+        # The second connector waits for the first's tunnel
+        rw_thread.join(0.1)
+        self.assertTrue(rw_thread.is_alive())
+
+        release.set()
+        thread.join(5)
+        rw_thread.join(5)
+
+        self.assertEqual(len(FakeForwarder.made), 1)
+        self.assertIs(self.ro._tunnel, self.rw._tunnel)
+        (entry,) = connectdb._TUNNEL_POOL.values()
+        self.assertEqual(entry[1], 2)
+        self.assertEqual(connectdb._TUNNEL_SETUP, {})
+
+    def test_setup_failure(self):
+        def on_start():
+            FakeForwarder.on_start = None
+            raise RuntimeError("handshake failed")
+
+        FakeForwarder.on_start = on_start
+        with self.assertRaises(connectdb.NoRouteToDatabase):
+            self.ro.ensure_route_to_database()
+        self.assertEqual(connectdb._TUNNEL_SETUP, {})
+
+        # The next connector tries again
+        self.rw.ensure_route_to_database()
+        self.assertEqual(len(FakeForwarder.made), 2)
+        self.assertTrue(self.rw._tunnel.is_active)
+
+
+if __name__ == "__main__":
+    unittest.main()